@@ -3,13 +3,25 @@ Controller module for handling user input and game loop.
 
 Classes:
     Controller: Manages the game loop and user input.
+    FrameLimiter: Paces the game loop to a fixed frame rate.
 """
 
+from functools import partial
+from time import perf_counter, sleep
 import pygame
 from view import View
-from model import Model
+from model import (Model, BTN_SINGLE, BTN_MULTI,
+                   BTN_EASY, BTN_MEDIUM, BTN_HARD)
 import settings
 
+# event types the controller reacts to, anything else is discarded,
+# an uncovered window has to be redrawn as a whole
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONUP,
+                  pygame.WINDOWEXPOSED)
+# event types let into the queue at all, mouse motion only wakes up
+# the menu so it can update the hover state
+ALLOWED_EVENTS = HANDLED_EVENTS + (pygame.MOUSEMOTION,)
+
 
 class Controller:
     """
@@ -19,7 +31,12 @@ class Controller:
         model (Model): The game model.
         view (View): The game view.
         running (bool): Flag to control the game loop.
-        fps (pygame.time.Clock): Clock to manage the frame rate.
+        fps (FrameLimiter): Limiter to manage the frame rate.
+        handle_player_movement_input (method): Movement input handler
+        for the chosen game mode.
+        render_menu (method): Renders the current menu screen.
+        menu_btns (tuple): Indices of the buttons shown on the current
+        menu screen, the only ones that can be clicked.
     """
 
     def __init__(self, model: Model, view: View):
@@ -31,61 +48,127 @@ class Controller:
         self.model = model
         self.view = view
         self.running = False
-        self.fps = pygame.time.Clock()
+        self.fps = FrameLimiter()
+        self._frame_events = []
+
+        # keep event types that are never used out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+
+        # movement keys bound once: p1 up, p1 down, p2 up, p2 down
+        self._keys = (pygame.K_w, pygame.K_s, pygame.K_UP, pygame.K_DOWN)
+
+        # input handler is picked when the game mode is applied,
+        # so the frame loop does not have to check the mode
+        if settings.GAME_MODE == "multiplayer":
+            self.handle_player_movement_input = self.handle_multi_player_input
+        else:
+            self.handle_player_movement_input = (
+                self.handle_single_player_input
+            )
+
+        # the loop of the current screen and the menu screen renderer
+        # are switched by the apply_* methods, so neither loop has to
+        # check the menu flags in settings
+        self._state = self._run_menu
+        self.render_menu = self.render_game_mode_menu
+        self.menu_btns = (BTN_SINGLE, BTN_MULTI)
+
+        # actions applied when a button is clicked, by button index
+        self._btn_dispatch = (
+            self.apply_single_mode,
+            self.apply_multi_mode,
+            partial(self.apply_difficulty, "easy"),
+            partial(self.apply_difficulty, "medium"),
+            partial(self.apply_difficulty, "hard")
+        )
+
+    def poll_events(self):
+        """
+        Read the events of the current frame from the queue once,
+        so all handlers work on the same list of events.
+        :return: None
+        """
+        # pump once, take only the relevant events and drop the rest
+        # so the queue cannot back up
+        pygame.event.pump()
+        self._frame_events = pygame.event.get(HANDLED_EVENTS, pump=False)
+        pygame.event.clear(pump=False)
 
     def handle_events(self, buttons_hovered=None):
         """
         A function to handle events like escape or mouse events.
-        :param buttons_hovered: A dictionary of buttons. Button name is
-        a key and a value is represented by a boolean
+        :param buttons_hovered: A list of booleans indicating which
+        buttons are hovered, ordered like menu_btns
         :return:None
         """
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.type == pygame.QUIT or event.key == pygame.K_ESCAPE:
-                    self.running = False
+        for event in self._frame_events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif (event.type == pygame.MOUSEBUTTONUP and event.button == 1
+                    and buttons_hovered is not None):
+                # apply the first hovered button of the current screen,
+                # buttons of the other screen are not drawn
+                for index, hovered in zip(self.menu_btns, buttons_hovered):
+                    if hovered:
+                        self._btn_dispatch[index]()
+                        # the hover state belongs to the screen before
+                        # the click, ignore further clicks until it is
+                        # tested again
+                        buttons_hovered = None
+                        break
 
-            if (event.type == pygame.MOUSEBUTTONUP and
-                    buttons_hovered is not None):
-                if (event.button == 1 and buttons_hovered["multi"] and not
-                        settings.game_mode_chosen):
-                    self.apply_multi_mode()
-                    # print("mode: multi")
-                elif (event.button == 1 and buttons_hovered["single"] and not
-                        settings.game_mode_chosen):
-                    self.apply_single_mode()
-                    # print("mode: single")
-                elif event.button == 1 and buttons_hovered["easy"]:
-                    self.apply_difficulty("easy")
-                    # print("diff: easy")
-                elif event.button == 1 and buttons_hovered["medium"]:
-                    self.apply_difficulty("medium")
-                    # print("diff: medium")
-                elif event.button == 1 and buttons_hovered["hard"]:
-                    self.apply_difficulty("hard")
-                    # print("diff: hard")
-
-    def handle_player_movement_input(self):
-        """
-        Handle user input for controlling the game.
+    def window_exposed(self):
+        """
+        Check whether the window was uncovered in the current frame.
+        :return: True if the frame's events contain a WINDOWEXPOSED event.
+        """
+        for event in self._frame_events:
+            if event.type == pygame.WINDOWEXPOSED:
+                return True
+        return False
+
+    def handle_single_player_input(self):
+        """
+        Handle user input for controlling the game in single player mode.
+        Player 2 is moved automatically.
         :return: None
         """
+        # get keys pressed, copied into locals in one go
+        pressed = pygame.key.get_pressed().__getitem__
+        w, s = self._keys[0], self._keys[1]
+        w_down, s_down = pressed(w), pressed(s)
 
-        # get keys pressed
-        keys = pygame.key.get_pressed()
+        # player movement
+        if w_down:
+            self.model.p1.move_up()
+        if s_down:
+            self.model.p1.move_down()
+        self.model.p2.auto_move(self.model.ball.y)
+
+    def handle_multi_player_input(self):
+        """
+        Handle user input for controlling the game in multiplayer mode.
+        :return: None
+        """
+        # get keys pressed, copied into locals in one go
+        pressed = pygame.key.get_pressed().__getitem__
+        w, s, up, down = self._keys
+        w_down, s_down, up_down, down_down = (
+            pressed(w), pressed(s), pressed(up), pressed(down)
+        )
 
         # player movement
-        if keys[pygame.K_w]:
+        if w_down:
             self.model.p1.move_up()
-        if keys[pygame.K_s]:
+        if s_down:
             self.model.p1.move_down()
-        if settings.GAME_MODE == "multiplayer":
-            if keys[pygame.K_UP]:
-                self.model.p2.move_up()
-            if keys[pygame.K_DOWN]:
-                self.model.p2.move_down()
-        else:
-            self.model.p2.auto_move(self.model.ball.pos, settings.SIZE)
+        if up_down:
+            self.model.p2.move_up()
+        if down_down:
+            self.model.p2.move_down()
 
     def apply_difficulty(self, difficulty):
         """
@@ -93,8 +176,10 @@ class Controller:
         :param difficulty: string representing the chosen difficulty level.
         :return: None
         """
-        settings.difficulty_chosen = True
         settings.DIFFICULTY = difficulty
+        # the game can only start once a game mode is chosen
+        if settings.game_mode_chosen:
+            self._state = self._run_game
         self.model.update_step()
 
     def apply_single_mode(self):
@@ -105,6 +190,9 @@ class Controller:
         settings.game_mode_chosen = True
         settings.GAME_MODE = "single"
         settings.AUTO = True
+        self.handle_player_movement_input = self.handle_single_player_input
+        self.render_menu = self.render_difficulty_menu
+        self.menu_btns = (BTN_EASY, BTN_MEDIUM, BTN_HARD)
         self.model.p2.auto = True
         self.model.update_step()
 
@@ -116,9 +204,34 @@ class Controller:
         settings.game_mode_chosen = True
         settings.GAME_MODE = "multiplayer"
         settings.AUTO = False
+        self.handle_player_movement_input = self.handle_multi_player_input
+        self._state = self._run_game
         self.model.update_step()
         # print(f"test, {settings.AUTO}")
 
+    def render_game_mode_menu(self):
+        """
+        Render the game mode selection menu.
+        :return: None
+        """
+        self.view.render_game_mode(
+            self.model.menu_state.buttons[BTN_SINGLE],
+            self.model.menu_state.buttons[BTN_MULTI]
+        )
+        self.view.flip()
+
+    def render_difficulty_menu(self):
+        """
+        Render the difficulty selection menu.
+        :return: None
+        """
+        self.view.render_difficulty(
+            self.model.menu_state.buttons[BTN_EASY],
+            self.model.menu_state.buttons[BTN_MEDIUM],
+            self.model.menu_state.buttons[BTN_HARD]
+        )
+        self.view.flip()
+
     def run(self):
         """
         Run the main game loop and control the game flow via an MVC pattern.
@@ -126,59 +239,199 @@ class Controller:
         """
         self.running = True
 
-        # main game loop
+        # run the loop of the current screen until the game is closed
         while self.running:
-            self.view.fill_screen(settings.SCREEN_FILL)
+            self._state()
 
-            if not settings.game_mode_chosen:
-                buttons_hovered = self.model.get_hovered_btns(
-                    pygame.mouse.get_pos()
-                )
-                self.model.change_color_if_hover(buttons_hovered)
+    def hover_menu_btns(self, mouse_pos):
+        """
+        Color the buttons of the current menu screen by their hover state.
+        :param mouse_pos: Tuple representing the mouse position (x, y).
+        :return: List of booleans indicating hover state,
+                 ordered like menu_btns.
+        """
+        buttons_hovered = self.model.get_hovered_btns(mouse_pos,
+                                                      self.menu_btns)
+        self.model.change_color_if_hover(buttons_hovered, self.menu_btns)
+        return buttons_hovered
 
-                self.view.render_game_mode(
-                    self.model.menu_state.buttons["single"],
-                    self.model.menu_state.buttons["multi"]
-                )
+    def _run_menu(self):
+        """
+        Run the menu loop until the game mode and difficulty are chosen.
+        The loop blocks on the event queue and the menu is only redrawn
+        when something visible changed.
+        :return: None
+        """
+        state = self._state
+        timeout = 1000 // settings.FRAMERATE
+        last_mouse_pos = pygame.mouse.get_pos()
+        buttons_hovered = self.hover_menu_btns(last_mouse_pos)
+        self.render_menu()
 
-                self.handle_events(buttons_hovered)
-                self.view.flip()
+        while self.running and self._state is state:
+            event = pygame.event.wait(timeout)
+            if event.type == pygame.NOEVENT:
                 continue
 
-            if (not settings.difficulty_chosen and
-                    settings.GAME_MODE == "single"):
-                buttons_hovered = self.model.get_hovered_btns(
-                    pygame.mouse.get_pos()
-                )
-                self.model.change_color_if_hover(buttons_hovered)
-
-                self.view.render_difficulty(
-                    self.model.menu_state.buttons["easy"],
-                    self.model.menu_state.buttons["medium"],
-                    self.model.menu_state.buttons["hard"]
-                )
-
-                self.handle_events(buttons_hovered)
-                self.view.flip()
-                continue
+            self.poll_events()
+            self._frame_events.insert(0, event)
+
+            # redraw only if the window was uncovered, the hover state
+            # changed or a click switched the menu screen
+            dirty = self.window_exposed()
+
+            # hover state can only change when the cursor moves, only
+            # the buttons on screen are tested
+            mouse_pos = pygame.mouse.get_pos()
+            if mouse_pos != last_mouse_pos:
+                hovered = self.model.get_hovered_btns(mouse_pos,
+                                                      self.menu_btns)
+                if hovered != buttons_hovered:
+                    buttons_hovered = hovered
+                    self.model.change_color_if_hover(buttons_hovered,
+                                                     self.menu_btns)
+                    dirty = True
+                last_mouse_pos = mouse_pos
+
+            render_menu = self.render_menu
+            self.handle_events(buttons_hovered)
+            if self.render_menu is not render_menu:
+                # the new screen shows other buttons
+                buttons_hovered = self.hover_menu_btns(mouse_pos)
+                dirty = True
+
+            if dirty and self.running and self._state is state:
+                self.render_menu()
+
+    def _run_game(self):
+        """
+        Run the game loop until there is a winner or the game is closed.
+        The game state is updated in fixed time steps, independent of
+        how long rendering a frame takes.
+        :return: None
+        """
+        framerate = settings.FRAMERATE
+        step_ms = 1000 / framerate
+        max_lag = step_ms * settings.MAX_UPDATES_PER_FRAME
+
+        # bind everything used per frame to locals once
+        get_ticks = pygame.time.get_ticks
+        poll_events = self.poll_events
+        handle_events = self.handle_events
+        window_exposed = self.window_exposed
+        redraw_all = self.view.redraw_all
+        handle_movement = self.handle_player_movement_input
+        update = self.model.update
+        render = self.view.render
+        tick = self.fps.tick
+
+        accumulator = 0.0
+        last_ticks = get_ticks()
+
+        while self.running:
+            now = get_ticks()
+            # after a long stall drop the excess instead of catching up
+            accumulator = min(accumulator + now - last_ticks, max_lag)
+            last_ticks = now
 
             # process input
-            self.handle_events()
-            self.handle_player_movement_input()
+            poll_events()
+            handle_events()
+            # parts of the window that were covered are not redrawn
+            # by the per-frame updates
+            if window_exposed():
+                redraw_all()
 
             # update game state
-            winner = None
+            while self.running and accumulator >= step_ms:
+                handle_movement()
 
-            # returns Player object if there's a winners
-            if self.model.update():
-                winner = self.model.check_winner()
-                self.running = False
+                # returns Player object if there's a winner
+                winner = update()
+                if winner is not None:
+                    # show the final state with the winner and stop
+                    self.running = False
+                    render(self.model, winner)
+                    pygame.time.wait(settings.DELAY_AFTER_VICTORY)
+                    return
 
-            # render changed state, winner argument is optional
-            self.view.render(self.model, winner)
+                accumulator -= step_ms
 
-            if self.running is False and winner is not None:
-                pygame.time.delay(settings.DELAY_AFTER_VICTORY)
+            # render changed state, the view erases the previous frame
+            render(self.model)
 
-            # cap framerate
-            self.fps.tick(settings.FRAMERATE)
+            # cap render rate
+            tick(framerate)
+
+
+class FrameLimiter:
+    """
+    Frame limiter that sleeps while enough of the frame is left and
+    busy-waits the rest, which keeps a steadier pace than a plain OS sleep
+    (it tends to oversleep, especially on Windows).
+    Attributes:
+        next_frame (float): perf_counter() time at which the next frame
+        is due, None before the first tick.
+        sleep_errors (list): Ring buffer of the latest sleep overshoots
+        in seconds.
+        index (int): Position in sleep_errors to be overwritten next.
+        worst_sleep (float): Largest overshoot in sleep_errors.
+    """
+    # power of two, so the ring buffer index can be wrapped with a mask
+    SAMPLES = 64
+
+    def __init__(self):
+        """
+        Initialize the FrameLimiter with a conservative sleep overshoot
+        estimate of 1 ms.
+        """
+        self.next_frame = None
+        self.sleep_errors = [0.001] * self.SAMPLES
+        self.index = 0
+        self.worst_sleep = 0.001
+
+    def tick(self, framerate):
+        """
+        Wait until the current frame has lasted 1 / framerate seconds.
+        :param framerate: Number of frames per second to keep.
+        :return: None
+        """
+        frame_time = 1 / framerate
+        if self.next_frame is None:
+            self.next_frame = perf_counter() + frame_time
+            return
+
+        while True:
+            remaining = self.next_frame - perf_counter()
+            if remaining <= 0:
+                break
+            # sleep only while an oversleep cannot miss the deadline,
+            # busy-wait the rest
+            if remaining > self.worst_sleep:
+                self.measured_sleep(remaining - self.worst_sleep,
+                                    frame_time / 2)
+
+        self.next_frame += frame_time
+        now = perf_counter()
+        # if a frame took too long, start over instead of rushing
+        # the following frames
+        if self.next_frame < now:
+            self.next_frame = now + frame_time
+
+    def measured_sleep(self, duration, max_error):
+        """
+        Sleep for the given duration and record how much longer
+        the sleep actually took.
+        :param duration: Time to sleep in seconds.
+        :param max_error: Largest overshoot to record in seconds.
+        :return: None
+        """
+        start = perf_counter()
+        sleep(duration)
+        # samples only age out on later sleeps, so a single huge oversleep
+        # (system load, suspend) must not stop the limiter from sleeping
+        self.sleep_errors[self.index] = min(
+            perf_counter() - start - duration, max_error
+        )
+        self.index = (self.index + 1) & (self.SAMPLES - 1)
+        self.worst_sleep = max(self.sleep_errors)
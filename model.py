@@ -11,11 +11,37 @@ Classes:
     Circ: Represents the ball in the game.
 """
 
-from random import choice, randint
+from random import choice
 from math import cos, sin, radians
 import pygame
 import settings
 
+# the window size is fixed, so it is unpacked once
+WIDTH, HEIGHT = settings.SIZE
+# game window area the paddles are kept in
+BOUNDS = pygame.Rect(0, 0, WIDTH, HEIGHT)
+# settings read during the game, bound once at import
+WINNING_SCORE = settings.WINNING_SCORE
+BALL_START_POS = settings.BALL_START_POS
+BALL_STEP = settings.BALL_STEP
+BALL_SPEED_INCREMENT = settings.BALL_SPEED_INCREMENT
+
+# indices of the menu buttons in MenuState.buttons
+BTN_SINGLE, BTN_MULTI, BTN_EASY, BTN_MEDIUM, BTN_HARD = range(5)
+
+# the ball never moves steeper than this many degrees from vertical
+SLOPE = 20
+
+# unit movement vectors (x, y) of the ball for every allowed whole angle,
+# grouped by angle range, y is inverted in pygame
+BALL_DIRECTIONS = tuple(
+    tuple((cos(radians(angle)), -sin(radians(angle)))
+          for angle in range(start, end + 1))
+    for start, end in ((0, 90 - SLOPE),
+                       (90 + SLOPE, 270 - SLOPE),
+                       (270 + SLOPE, 360))
+)
+
 
 class Model:
     """
@@ -66,32 +92,35 @@ class Model:
         """
         # returns player object if there's a winner, else None
         # players were already moved in controller
-        self.p1.prevent_exceed(settings.SIZE)
-        self.p2.prevent_exceed(settings.SIZE)
-
-        # move ball
-        self.update_ball_pos()
+        p1, p2, ball = self.p1, self.p2, self.ball
+        p1.prevent_exceed()
+        p2.prevent_exceed()
+
+        # move ball and detect collisions, the ball's position is read
+        # and written back once
+        x, y, horizontal_collision, hit, vertical_collision = self.ball_step(
+            ball.x, ball.y, ball.mx, ball.my, ball.radius, p1.rect, p2.rect
+        )
+        ball.x, ball.y = x, y
+        if horizontal_collision:
+            ball.bounce("horizontal")
 
-        # collision detection
-        if self.ball_horizontal_wall_collision(self.ball):
-            self.ball.bounce("horizontal")
-        if (self.player_collision(self.ball, self.p1) or
-                self.player_collision(self.ball, self.p2)):
-            self.ball.speed_up(settings.BALL_SPEED_INCREMENT)
-            self.ball.bounce("vertical")
+        # only bounce a ball that is still moving towards the paddle
+        if hit * ball.mx < 0:
+            ball.speed_up(BALL_SPEED_INCREMENT)
+            ball.bounce("vertical")
 
-        vertical_collision = self.ball_vertical_wall_collision(self.ball)
         # if collision is for left wall, player 2 scores, and vice versa
         if vertical_collision != 0:
             if vertical_collision == -1:
-                self.p2.append_score()
+                p2.append_score()
             else:
-                self.p1.append_score()
+                p1.append_score()
 
             winner = self.check_winner()
             # do not move the ball if there's a winner
             if winner is None:
-                self.ball.start_over()
+                ball.start_over()
 
             return winner
         return None
@@ -111,98 +140,73 @@ class Model:
         Check if either player has reached the winning score.
         :return: Player object if there's a winner, else None.
         """
-        if self.p1.get_score() >= settings.WINNING_SCORE:
+        if self.p1.score >= WINNING_SCORE:
             return self.p1
-        if self.p2.get_score() >= settings.WINNING_SCORE:
+        if self.p2.score >= WINNING_SCORE:
             return self.p2
         return None
 
-    def update_ball_pos(self):
-        """
-        Update the ball's position and
-         its hitbox based on its current movement.
-        :return: None
-        """
-        self.ball.pos = (
-            self.ball.pos[0] + self.ball.get_x_movement(),
-            self.ball.pos[1] + self.ball.get_y_movement()
-        )
-        self.ball.update_hitbox()
-
-    def change_color_if_hover(self, buttons):
+    def change_color_if_hover(self, buttons, indices):
         """
-        Change each button's color based on whether it is hovered over.
-        :param buttons: Dictionary with button names as keys and
-                        boolean values indicating hover state.
+        Change each given button's color based on whether it is hovered over.
+        :param buttons: List of booleans indicating hover state,
+                        ordered like indices.
+        :param indices: BTN_* indices of the buttons to recolor.
         :return: None
         """
-        for key in buttons.keys():
-            self.menu_state.buttons[key].set_hover_color(
-                buttons[key]
-            )
-
-    def get_hovered_btns(self, mouse_pos):
-        """
-        Get a dictionary indicating which buttons are hovered over
-        :param mouse_pos: Tuple representing the mouse position (x, y).
-        :return: Dictionary with button names as keys and
-                 boolean values indicating hover state.
-        """
-        buttons = {}
-        for key in self.menu_state.buttons.keys():
-            if self.mouse_over_btn(key, mouse_pos):
-                buttons[key] = True
-            else:
-                buttons[key] = False
-        return buttons
+        all_buttons = self.menu_state.buttons
+        # same as Button.set_hover_color, inlined for the menu loop
+        for index, is_hover in zip(indices, buttons):
+            btn = all_buttons[index]
+            btn.color = btn.hover_color if is_hover else btn.not_hover_color
 
-    def mouse_over_btn(self, name, mouse_pos):
+    def get_hovered_btns(self, mouse_pos, indices):
         """
-        Check if the mouse is over a specific button.
-        :param name: Name of the button to check
-        (buttons are stored in a dictionary).
+        Get a list indicating which of the given buttons are hovered over
         :param mouse_pos: Tuple representing the mouse position (x, y).
-        :return: Boolean indicating if the mouse is over the button.
+        :param indices: BTN_* indices of the buttons to test.
+        :return: List of booleans indicating hover state,
+                 ordered like indices.
         """
-        if self.menu_state.buttons[name].rect.collidepoint(mouse_pos):
-            return True
-        return False
+        all_buttons = self.menu_state.buttons
+        return [all_buttons[index].rect.collidepoint(mouse_pos)
+                for index in indices]
 
     @staticmethod
-    def player_collision(ball_obj, player):
-        """
-        Check for collision between ball and player paddle
-        using pygame colliderect function.
-        :param ball_obj: Circ object representing the ball.
-        :param player: Player object representing the player.
-        :return: Boolean indicating if a collision occurred.
+    def ball_step(x, y, mx, my, radius, p1_rect, p2_rect):
+        """
+        Move the ball by its movement and detect its collisions with
+        the walls and paddles. Works on plain numbers only, the caller
+        applies the results to the game objects.
+        :param x: Horizontal position of the ball.
+        :param y: Vertical position of the ball.
+        :param mx: Movement of the ball in the x direction.
+        :param my: Movement of the ball in the y direction.
+        :param radius: Radius of the ball.
+        :param p1_rect: Rect of player 1's (left) paddle.
+        :param p2_rect: Rect of player 2's (right) paddle.
+        :return: Tuple (x, y, bounce, hit, wall) with the new position,
+                 whether the ball hit the top or bottom wall,
+                 the paddle hit (1 for player 1, -1 for player 2, 0 for none)
+                 and the vertical wall hit (-1 for left, 1 for right,
+                 0 for none).
         """
-        return player.rect.colliderect(ball_obj.rect)
+        x += mx
+        y += my
 
-    @staticmethod
-    def ball_horizontal_wall_collision(ball_obj):
-        """
-        Check for collision between ball and horizontal walls (top and bottom).
-        :param ball_obj: Circ object representing the ball.
-        :return: boolean indicating if a collision occurred.
-        """
-        return (ball_obj.pos[1] - ball_obj.radius <= 0 or
-                ball_obj.pos[1] + ball_obj.radius >= settings.SIZE[1])
+        # top and bottom walls
+        bounce = y - radius <= 0 or y + radius >= HEIGHT
 
-    @staticmethod
-    def ball_vertical_wall_collision(ball_obj):
-        """
-        Check for collision between ball and vertical walls (left and right).
-        :param ball_obj: Circ object representing the ball.
-        :return: Integer indicating which wall was hit:
-                    -1 for left wall, 1 for right wall, 0 for no collision.
-        """
-        # returns -1 for left, 0 for none, 1 for right
-        if ball_obj.pos[0] - ball_obj.radius <= 0:
-            return -1
-        if ball_obj.pos[0] + ball_obj.radius >= settings.SIZE[0]:
-            return 1
-        return 0
+        # ball's bounding box against both paddles
+        hit = ((p1_rect.top - radius < y < p1_rect.bottom + radius and
+                x - radius < p1_rect.right) -
+               (p2_rect.top - radius < y < p2_rect.bottom + radius and
+                x + radius > p2_rect.left))
+
+        # left and right walls
+        wall = (x + radius >= WIDTH) - (x - radius <= 0)
+
+        return x, y, bounce, hit, wall
 
 
 class Player:
@@ -218,7 +222,6 @@ class Player:
         step (int): The movement step size for the player.
         score (int): The player's score.
     """
-    score = 0
 
     def __init__(self, starting_pos, rect_size, color,
                  step, name, auto=False, difficulty_step=0):
@@ -237,6 +240,7 @@ class Player:
                                 rect_size[0], rect_size[1])
         self.color = color
         self.name = name
+        self.score = 0
         self.auto = auto
         if auto:
             self.step = difficulty_step
@@ -262,26 +266,22 @@ class Player:
         Move the player's paddle down by the step size.
         :return: None
         """
-        self.rect = self.rect.move(0, self.step)
+        self.rect.move_ip(0, self.step)
 
     def move_up(self):
         """
         Move the player's paddle up by the step size.
         :return: None
         """
-        self.rect = self.rect.move(0, -self.step)
+        self.rect.move_ip(0, -self.step)
 
-    def prevent_exceed(self, size):
+    def prevent_exceed(self):
         """
         Prevent player from exceeding the game window boundaries
         by adjusting the paddle position if necessary.
-        :param size: Tuple representing the game window size (width, height).
         :return: None
         """
-        if self.rect.top < 0:
-            self.rect.top = 0
-        if self.rect.bottom > size[1]:
-            self.rect.bottom = size[1]
+        self.rect.clamp_ip(BOUNDS)
 
     def append_score(self):
         """
@@ -297,34 +297,20 @@ class Player:
         """
         return self.score
 
-    def auto_move(self, ball_pos, size):
+    def auto_move(self, ball_y):
         """
         Automatically move the player's paddle based on the ball's position.
-        :param ball_pos: Position of the ball (x, y).
-        :param size: Size of the game window (width, height).
+        :param ball_y: Vertical position of the ball.
         :return: None
         """
+        center = self.rect.centery
         # only move if ball is not within paddle
-        ball_within_paddle = (
-                self.rect.top <= ball_pos[1] <=
-                self.rect.top + self.rect.height)
-        if self.auto and not ball_within_paddle:
-            rect_x1 = self.rect.top
-            rect_x2 = self.rect.top + self.rect.height
-
-            is_too_low = ball_pos[1] < (rect_x1 + rect_x2) / 2
-            is_too_high = ball_pos[1] > (rect_x1 + rect_x2) / 2
+        if not self.auto or abs(ball_y - center) <= self.rect.height // 2:
+            return
 
-            next_top = self.rect.top - self.step
-            next_bottom = self.rect.top + self.rect.height + self.step
-
-            not_out_of_bounds_up = next_top >= 0
-            not_out_of_bounds_down = next_bottom <= size[1]
-
-            if is_too_low and not_out_of_bounds_up:
-                self.move_up()
-            elif is_too_high and not_out_of_bounds_down:
-                self.move_down()
+        # move towards the ball, but not out of the window
+        self.rect.move_ip(0, self.step if ball_y > center else -self.step)
+        self.rect.clamp_ip(BOUNDS)
 
 
 class Circ:
@@ -332,14 +318,15 @@ class Circ:
     Circ class to represent the ball in the game.
     Attributes:
         radius (int): The radius of the ball.
-        pos (tuple): The position of the ball (x, y).
+        x (float): The horizontal position of the ball.
+        y (float): The vertical position of the ball.
         color (tuple): The color of the ball (R, G, B).
         step (int): The movement step size for the ball.
-        movement (tuple): The current movement vector of the ball
-        (x_movement, y_movement).
+        ux (float): The x component of the ball's unit direction.
+        uy (float): The y component of the ball's unit direction.
+        mx (float): The current movement of the ball in the x direction.
+        my (float): The current movement of the ball in the y direction.
     """
-    radius = color = step = 0
-    pos = movement = (0, 0)
 
     def __init__(self, radius, pos, color, step):
         """
@@ -350,26 +337,13 @@ class Circ:
         :param step: Number of pixels the ball moves per action.
         """
         self.radius = radius
-        self.pos = pos
+        self.x, self.y = pos
         self.color = color
         self.step = step
-        self.rect = None
-        self.update_hitbox()
+        self.ux = self.uy = 0
+        self.mx = self.my = 0
         self.randomize_movement()
 
-    def update_hitbox(self):
-        """
-        Update the ball's hitbox (pygame Rect) position
-        based on its current position and radius.
-        :return: None
-        """
-        self.rect = pygame.Rect(
-            self.pos[0] - self.radius,
-            self.pos[1] - self.radius,
-            self.radius * 2,
-            self.radius * 2
-        )
-
     def bounce(self, which_wall):
         """
         Bounce the ball off a wall by inverting
@@ -379,56 +353,45 @@ class Circ:
         :return: None
         """
         if which_wall == "vertical":
-            self.movement = ((-1) * self.movement[0], self.movement[1])
+            self.ux = -self.ux
+            self.mx = -self.mx
         if which_wall == "horizontal":
-            self.movement = (self.movement[0], (-1) * self.movement[1])
+            self.uy = -self.uy
+            self.my = -self.my
 
     def randomize_movement(self):
         """
         Randomize the ball's movement direction while avoiding steep angles
-        (indicated by slope variable).
+        (indicated by SLOPE constant).
         :return: None
         """
-        slope = 20
-
-        # pick an angle that is no steeper than the slope
-        ranges = [(0, 90 - slope),
-                  (90 + slope, 270 - slope),
-                  (270 + slope, 360)]
-        angle_range = choice(ranges)
-        angle = randint(angle_range[0], angle_range[1])
+        # pick an angle range, then an angle from the precomputed directions
+        self.ux, self.uy = choice(choice(BALL_DIRECTIONS))
 
-        # calculate x and y movement based on an angle
-        x = self.step * cos(radians(angle))
-        y = self.step * sin(radians(angle))
-
-        self.movement = (
-            x,  # Xaxis
-            (-1) * y  # Yaxis is inverted in pygame
-        )
+        self.mx = self.step * self.ux
+        self.my = self.step * self.uy
 
     def get_x_movement(self):
         """
         Get the ball's movement in the x direction.
         :return: Number of pixels the ball moves in the x direction.
         """
-        return self.movement[0]
+        return self.mx
 
     def get_y_movement(self):
         """
         Get the ball's movement in the y direction.
         :return: Number of pixels the ball moves in the y direction.
         """
-        return self.movement[1]
+        return self.my
 
     def move_to_start(self, start_pos):
         """
-        Move the ball and its hitbox to the starting position.
+        Move the ball to the starting position.
         :param start_pos: Position to move the ball to (x, y).
         :return: None
         """
-        self.pos = start_pos
-        self.update_hitbox()
+        self.x, self.y = start_pos
 
     def speed_up(self, increment, up=True):
         """
@@ -439,20 +402,14 @@ class Circ:
                     or set (False) the step value.
         :return: None
         """
-        self.movement = (
-            self.movement[0] / self.step,
-            self.movement[1] / self.step
-        )
-
         if up:
             self.step += increment
         else:
             self.step = increment
 
-        self.movement = (
-            self.movement[0] * self.step,
-            self.movement[1] * self.step
-        )
+        # movement is the unit direction scaled by the new step
+        self.mx = self.ux * self.step
+        self.my = self.uy * self.step
 
     def set_step(self, step):
         """
@@ -469,36 +426,36 @@ class Circ:
         and reset its speed to the initial step value.
         :return: None
         """
-        self.move_to_start(settings.BALL_START_POS)
+        self.move_to_start(BALL_START_POS)
         self.randomize_movement()
-        self.set_step(settings.BALL_STEP)
+        self.set_step(BALL_STEP)
 
 
 class MenuState:
     """
     Class to hold instances of menu elements.
     Attributes:
-        buttons: Dictionary of Button objects.
+        buttons: Tuple of Button objects, indexed by the BTN_* constants.
     """
     def __init__(self):
         """
         Initialize the MenuState with buttons for game mode and
-        difficulty selection. Buttons are stored in a dictionary
-        with their names as keys and Button objects as values.
+        difficulty selection. Buttons are stored in a tuple
+        indexed by the BTN_* constants.
         Buttons:
-            - "single": Button for playing singleplayer mode.
-            - "multi": Button for playing multiplayer mode.
-            - "easy": Button for selecting easy difficulty.
-            - "medium": Button for selecting medium difficulty.
-            - "hard": Button for selecting hard difficulty.
-        """
-        self.buttons = {
-            "single": self.create_button("Singleplayer", False, 0),
-            "multi": self.create_button("Multiplayer", False, 1),
-            "easy": self.create_button("Easy", True, 0),
-            "medium": self.create_button("Medium", True, 1),
-            "hard": self.create_button("Hard", True, 2)
-        }
+            - BTN_SINGLE: Button for playing singleplayer mode.
+            - BTN_MULTI: Button for playing multiplayer mode.
+            - BTN_EASY: Button for selecting easy difficulty.
+            - BTN_MEDIUM: Button for selecting medium difficulty.
+            - BTN_HARD: Button for selecting hard difficulty.
+        """
+        self.buttons = (
+            self.create_button("Singleplayer", False, 0),
+            self.create_button("Multiplayer", False, 1),
+            self.create_button("Easy", True, 0),
+            self.create_button("Medium", True, 1),
+            self.create_button("Hard", True, 2)
+        )
 
     @staticmethod
     def create_button(text, is_difficulty, multiplier):
@@ -19,6 +19,7 @@ SIZE = (1600, 1200)
 SCREEN_FILL = (0, 0, 0)  # black
 WINDOW_TITLE = "Pong"
 FRAMERATE = 60
+MAX_UPDATES_PER_FRAME = 5  # game state updates allowed to catch up a frame
 
 # button constants
 BUTTON_HEIGHT = 100
@@ -63,7 +64,6 @@ DELAY_AFTER_VICTORY = 3000  # milliseconds
 # lower case styled names are not constants
 game_mode_chosen = False  # flag to indicate whether game mode has been chosen
 GAME_MODE = "single"  # single or multiplayer
-difficulty_chosen = False
 DIFFICULTY = "easy"  # easy, medium, hard
 DIFFICULTIES = {
     "easy": 5,
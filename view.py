@@ -9,6 +9,10 @@ import pygame
 import settings
 from model import Model
 
+# settings read during the game, bound once at import
+WIDTH, HEIGHT = settings.SIZE
+TEXT_COLOR = settings.TEXT_COLOR
+
 
 class View:
     """
@@ -29,6 +33,39 @@ class View:
 
         self.font = pygame.font.Font(settings.FONT, settings.FONT_SIZE)
 
+        # score text is always centered at the same point
+        self._score_center = (WIDTH // 2, settings.FONT_SIZE)
+        # rendered score surfaces and their top left corners by
+        # (player 1 score, player 2 score), scores never exceed
+        # WINNING_SCORE so the cache stays small
+        self._score_cache = {}
+
+        # background is painted once and copied back over the areas
+        # drawn in the previous frame
+        self._bg = pygame.Surface(settings.SIZE).convert()
+        self._bg.fill(settings.SCREEN_FILL)
+        self._drawn_rects = []
+
+        # paddles and ball never change their look, so they are drawn
+        # once and only blitted per frame
+        self._paddle = pygame.Surface(settings.RECT_SIZE).convert()
+        self._paddle.fill(settings.RECT_COLOR)
+        radius = settings.BALL_RADIUS
+        self._ball = pygame.Surface((2 * radius, 2 * radius),
+                                    pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self._ball, settings.BALL_COLOR,
+                           (radius, radius), radius)
+        # set when the whole screen was painted over, e.g. by a menu
+        self._full_redraw = True
+
+    def redraw_all(self):
+        """
+        Make the next render repaint and update the whole screen
+        instead of only the areas that changed.
+        :return: None
+        """
+        self._full_redraw = True
+
     def fill_screen(self, color):
         """
         Fill the screen with the specified color.
@@ -42,27 +79,33 @@ class View:
         Display the current score of both players on the screen.
         :param player1: Player object representing player 1.
         :param player2: Player object representing player 2.
-        :return: None
+        :return: Rect of the screen area the score was drawn on.
         """
-        score_text = f"{player1.get_score()} : {player2.get_score()}"
-        text_surface = self.font.render(score_text, True, settings.TEXT_COLOR)
-        text_box = text_surface.get_rect()
-        text_box.center = (settings.SIZE[0] // 2, settings.FONT_SIZE)
-        self.screen.blit(text_surface, text_box)
+        score = (player1.score, player2.score)
+        cached = self._score_cache.get(score)
+        # the score changes at most once per rally, render it only then
+        if cached is None:
+            score_text = f"{score[0]} : {score[1]}"
+            text_surface = self.font.render(score_text, True, TEXT_COLOR)
+            text_box = text_surface.get_rect(center=self._score_center)
+            cached = (text_surface, text_box.topleft)
+            self._score_cache[score] = cached
+
+        return self.screen.blit(*cached)
 
     def victory_screen(self, winner):
         """
         Display the victory screen for the winning player.
         :param winner: Player object representing the winning player.
-        :return: None
+        :return: Rect of the screen area the text was drawn on.
         """
         victory_text = f"{winner.name} Wins"
         text_surface = self.font.render(victory_text,
                                         True,
-                                        settings.TEXT_COLOR)
+                                        TEXT_COLOR)
         text_box = text_surface.get_rect()
-        text_box.center = (settings.SIZE[0] // 2, settings.SIZE[1] // 2)
-        self.screen.blit(text_surface, text_box)
+        text_box.center = (WIDTH // 2, HEIGHT // 2)
+        return self.screen.blit(text_surface, text_box)
 
     def render(self, model: Model, winner=None):
         """
@@ -71,24 +114,38 @@ class View:
         :param winner: Player object representing the winning player, if any.
         :return: None
         """
-        pygame.draw.rect(self.screen,
-                         model.p1.get_color(),
-                         model.p1.get_dimensions())
-
-        pygame.draw.rect(self.screen,
-                         model.p2.get_color(),
-                         model.p2.get_dimensions())
-
-        pygame.draw.circle(self.screen,
-                           model.ball.color,
-                           model.ball.pos,
-                           model.ball.radius)
-
-        self.display_score(model.p1, model.p2)
+        screen = self.screen
+        p1, p2, ball = model.p1, model.p2, model.ball
+
+        # erase last frame's objects, or everything after a menu screen
+        bg = self._bg
+        if self._full_redraw:
+            screen.blit(bg, (0, 0))
+            self._full_redraw = False
+            erased = None
+        else:
+            erased = self._drawn_rects
+            for rect in erased:
+                screen.blit(bg, rect, rect)
+
+        # paddles and ball in a single call, the ball surface's top left
+        # corner is one radius up and left of its center
+        radius = ball.radius
+        drawn = screen.blits((
+            (self._paddle, p1.rect),
+            (self._paddle, p2.rect),
+            (self._ball, (int(ball.x) - radius, int(ball.y) - radius))
+        ))
+        drawn.append(self.display_score(p1, p2))
         if winner:
-            self.victory_screen(winner)
+            drawn.append(self.victory_screen(winner))
+        self._drawn_rects = drawn
 
-        self.flip()
+        # push only the erased and redrawn areas to the display
+        if erased is None:
+            self.flip()
+        else:
+            pygame.display.update(erased + drawn)
 
     @staticmethod
     def flip():
@@ -110,6 +167,7 @@ class View:
             settings.BUTTON_FONT_SIZE
         )
         self.screen.fill("black")
+        self._full_redraw = True
 
         # display button one
         self.show_button(btn1, button_font)
@@ -130,6 +188,7 @@ class View:
             settings.BUTTON_FONT_SIZE
         )
         self.screen.fill("black")
+        self._full_redraw = True
 
         self.show_button(btn1, button_font)
         self.show_button(btn2, button_font)